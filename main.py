@@ -1,10 +1,13 @@
 import os
-from flask import Flask, request, jsonify
+from itertools import islice
+from flask import Flask, request, jsonify, Response, stream_with_context
 from flask_sqlalchemy import SQLAlchemy
 from flask_cors import CORS
 from werkzeug.exceptions import HTTPException
 from functools import wraps
 from datetime import datetime
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 # =========================================
 # Configurações iniciais
@@ -89,6 +92,80 @@ def handle_http_exception(e):
 def handle_exception(e):
     return jsonify({"error": {"code": 500, "message": "Erro interno do servidor"}}), 500
 
+# =========================================
+# Formatos colunares (analytics)
+# =========================================
+ARROW_STREAM_MIMETYPE = "application/vnd.apache.arrow.stream"
+PARQUET_MIMETYPE = "application/vnd.apache.parquet"
+FORMATOS_COLUNARES = [ARROW_STREAM_MIMETYPE, PARQUET_MIMETYPE]
+ENDPOINTS_COLUNARES = ["listar_pacientes", "listar_profissionais", "listar_consultas"]
+TAMANHO_LOTE_COLUNAR = 10000
+TIPOS_COLUNARES = {"int": pa.int64(), "str": pa.string(), "datetime": pa.timestamp("us")}
+
+def formato_colunar():
+    # JSON continua sendo o padrão (inclusive para Accept: */*)
+    melhor = request.accept_mimetypes.best_match(["application/json"] + FORMATOS_COLUNARES, default="application/json")
+    return melhor if melhor in FORMATOS_COLUNARES else None
+
+class _SaidaEmPartes:
+    # Arquivo "write-only" que acumula bytes até serem repassados ao cliente
+    closed = False
+
+    def __init__(self):
+        self.partes = []
+        self.posicao = 0
+
+    def write(self, dados):
+        self.partes.append(bytes(dados))
+        self.posicao += len(dados)
+        return len(dados)
+
+    def tell(self):
+        return self.posicao
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def esvaziar(self):
+        dados = b"".join(self.partes)
+        self.partes = []
+        return dados
+
+def resposta_colunar(query, colunas, mimetype):
+    # colunas: lista de (nome, tipo), com tipo em "int", "str" ou "datetime".
+    # O resultado é lido em lotes (yield_per) e cada lote vira um RecordBatch
+    # enviado assim que pronto, sem manter o resultado inteiro em memória.
+    schema = pa.schema([(nome, TIPOS_COLUNARES[tipo]) for nome, tipo in colunas])
+
+    def gerar():
+        saida = _SaidaEmPartes()
+        if mimetype == PARQUET_MIMETYPE:
+            writer = pq.ParquetWriter(saida, schema)
+        else:
+            writer = pa.ipc.new_stream(saida, schema)
+        linhas = iter(query.yield_per(TAMANHO_LOTE_COLUNAR))
+        while True:
+            lote = list(islice(linhas, TAMANHO_LOTE_COLUNAR))
+            if not lote:
+                break
+            arrays = [pa.array(v, type=f.type) for v, f in zip(zip(*lote), schema)]
+            writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+            yield saida.esvaziar()
+        writer.close()
+        yield saida.esvaziar()
+
+    return Response(stream_with_context(gerar()), mimetype=mimetype), 200
+
+@app.after_request
+def vary_accept(resp):
+    # Mesma URL, corpos diferentes conforme o Accept (inclusive o JSON)
+    if request.endpoint in ENDPOINTS_COLUNARES:
+        resp.vary.add("Accept")
+    return resp
+
 # =========================================
 # Endpoints básicos
 # =========================================
@@ -111,6 +188,10 @@ def init_db():
 # =========================================
 @app.route("/api/pacientes", methods=["GET"])
 def listar_pacientes():
+    formato = formato_colunar()
+    if formato:
+        query = db.session.query(Paciente.id, Paciente.nome, Paciente.email, Paciente.criado_em).order_by(Paciente.id)
+        return resposta_colunar(query, [("id", "int"), ("nome", "str"), ("email", "str"), ("criado_em", "datetime")], formato)
     pacientes = Paciente.query.all()
     data = [{"id": p.id, "nome": p.nome, "email": p.email, "criado_em": p.criado_em.isoformat()} for p in pacientes]
     return jsonify({"data": data}), 200
@@ -169,6 +250,10 @@ def deletar_paciente(id):
 # =========================================
 @app.route("/api/profissionais", methods=["GET"])
 def listar_profissionais():
+    formato = formato_colunar()
+    if formato:
+        query = db.session.query(Profissional.id, Profissional.nome, Profissional.especialidade, Profissional.criado_em).order_by(Profissional.id)
+        return resposta_colunar(query, [("id", "int"), ("nome", "str"), ("especialidade", "str"), ("criado_em", "datetime")], formato)
     pro = Profissional.query.all()
     data = [{"id": pr.id, "nome": pr.nome, "especialidade": pr.especialidade, "criado_em": pr.criado_em.isoformat()} for pr in pro]
     return jsonify({"data": data}), 200
@@ -219,6 +304,19 @@ def deletar_profissional(id):
 # =========================================
 @app.route("/api/consultas", methods=["GET"])
 def listar_consultas():
+    formato = formato_colunar()
+    if formato:
+        # Colunas planas direto do JOIN, sem materializar objetos ORM
+        query = (db.session.query(
+                    Consulta.id, Consulta.paciente_id, Paciente.nome, Consulta.profissional_id,
+                    Profissional.nome, Consulta.data, Consulta.status, Consulta.criado_em)
+                 .join(Paciente, Consulta.paciente_id == Paciente.id)
+                 .join(Profissional, Consulta.profissional_id == Profissional.id)
+                 .order_by(Consulta.data))
+        return resposta_colunar(query, [
+            ("id", "int"), ("paciente_id", "int"), ("paciente_nome", "str"), ("profissional_id", "int"),
+            ("profissional_nome", "str"), ("data", "datetime"), ("status", "str"), ("criado_em", "datetime")
+        ], formato)
     cs = Consulta.query.order_by(Consulta.data).all()
     data = []
     for c in cs:
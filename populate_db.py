@@ -1 +1,182 @@
-Inherited file content will not be shown
\ No newline at end of file
+import sys
+import random
+import argparse
+import unicodedata
+from itertools import islice
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, select
+from main import app, db, Paciente, Profissional, Consulta
+
+# =========================================
+# Gerador de dados sintéticos (dev / testes de escala)
+# =========================================
+# Uso: python populate_db.py --pacientes 100000 --profissionais 500 --consultas 1000000 --seed 42 --reset
+# Em testes: DATABASE_URL=sqlite:// antes de importar main e então popular(...) (ver tests/).
+# Mesma seed + mesmos tamanhos = mesmos dados. Datas partem de DATA_BASE (e não de "agora")
+# para que a saída seja reproduzível.
+
+DATA_BASE = datetime(2025, 9, 1)
+TAMANHO_LOTE = 10000
+
+NOMES = [
+    "Ana", "Beatriz", "Bruno", "Camila", "Carlos", "Daniela", "Eduardo", "Fernanda", "Gabriel", "Helena",
+    "Igor", "Juliana", "João", "Larissa", "Lucas", "Mariana", "Mateus", "Natália", "Paulo", "Rafaela",
+    "Ricardo", "Sofia", "Thiago", "Vanessa", "Vitor",
+]
+SOBRENOMES = [
+    "Almeida", "Araújo", "Barbosa", "Cardoso", "Carvalho", "Costa", "Ferreira", "Gomes", "Lima", "Martins",
+    "Mendes", "Moreira", "Oliveira", "Pereira", "Ribeiro", "Rocha", "Santos", "Silva", "Souza", "Teixeira",
+]
+ESPECIALIDADES = [
+    "Cardiologia", "Clínica Geral", "Dermatologia", "Endocrinologia", "Ginecologia", "Neurologia",
+    "Nutrição", "Ortopedia", "Pediatria", "Psicologia", "Psiquiatria",
+]
+# Pesos aproximados da distribuição de status
+STATUS_CONSULTA = ["agendada", "confirmada", "realizada", "cancelada"]
+PESOS_STATUS = [30, 20, 40, 10]
+
+DIAS_SEMANA = ["Segunda", "Terça", "Quarta", "Quinta", "Sexta", "Sábado"]
+TURNOS = [("08:00", "12:00"), ("09:00", "12:00"), ("13:00", "17:00"), ("14:00", "18:00")]
+TIPOS_ATENDIMENTO = ["Presencial", "Online"]
+
+
+def _slug(texto):
+    return unicodedata.normalize("NFKD", texto).encode("ascii", "ignore").decode().lower()
+
+def _nome_completo(rng):
+    return f"{rng.choice(NOMES)} {rng.choice(SOBRENOMES)} {rng.choice(SOBRENOMES)}"
+
+def _criado_em(rng):
+    return DATA_BASE - timedelta(seconds=rng.randrange(365 * 24 * 3600))
+
+# =========================================
+# Geradores de linhas (tuplas na ordem das colunas)
+# =========================================
+def gerar_pacientes(rng, n, inicio=1):
+    for i in range(inicio, inicio + n):
+        nome = _nome_completo(rng)
+        # sufixo sequencial garante a unicidade exigida em pacientes.email
+        email = f"{_slug(nome).replace(' ', '.')}.{i}@exemplo.com"
+        yield (nome, email, _criado_em(rng))
+
+def gerar_profissionais(rng, n):
+    for _ in range(n):
+        prefixo = rng.choice(["Dr.", "Dra."])
+        yield (f"{prefixo} {_nome_completo(rng)}", rng.choice(ESPECIALIDADES), _criado_em(rng))
+
+def gerar_consultas(rng, n, paciente_ids, profissional_ids):
+    # paciente_ids / profissional_ids: listas de ids reais lidos do banco (_ids)
+    for _ in range(n):
+        dia = DATA_BASE + timedelta(days=rng.randrange(-180, 180))
+        while dia.weekday() == 6:
+            dia += timedelta(days=1)
+        # slots de 30 min entre 08:00 e 17:30
+        data = dia.replace(hour=8) + timedelta(minutes=30 * rng.randrange(20))
+        status = rng.choices(STATUS_CONSULTA, weights=PESOS_STATUS)[0]
+        yield (rng.choice(paciente_ids), rng.choice(profissional_ids), data, status, _criado_em(rng))
+
+def gerar_agenda(rng, profissional_ids):
+    # Linhas no formato da aba Agenda_Profissional consumida por gerar_slots.py
+    for pid in profissional_ids:
+        for dia_semana in rng.sample(DIAS_SEMANA, rng.randint(2, 4)):
+            inicio, fim = rng.choice(TURNOS)
+            yield (f"P{pid:03d}", dia_semana, inicio, fim, rng.choice(TIPOS_ATENDIMENTO))
+
+# =========================================
+# Inserção em lote
+# =========================================
+def inserir_em_lote(conn, modelo, colunas, linhas, tamanho_lote=TAMANHO_LOTE):
+    # conn: Connection do SQLAlchemy dentro de uma transação aberta (engine.begin())
+    tabela = modelo.__table__
+    if conn.dialect.driver == "psycopg":
+        # COPY via psycopg 3: bem mais rápido que INSERTs para milhões de linhas.
+        # Outros drivers PostgreSQL (ex.: psycopg2) seguem pelo executemany abaixo.
+        with conn.connection.driver_connection.cursor() as cur:
+            with cur.copy(f"COPY {tabela.name} ({', '.join(colunas)}) FROM STDIN") as copy:
+                for linha in linhas:
+                    copy.write_row(linha)
+        return
+
+    linhas = iter(linhas)
+    while True:
+        lote = [dict(zip(colunas, linha)) for linha in islice(linhas, tamanho_lote)]
+        if not lote:
+            break
+        conn.execute(tabela.insert(), lote)
+
+def _maior_id(conn, modelo):
+    return conn.execute(select(func.max(modelo.id))).scalar() or 0
+
+def _ids(conn, modelo, acima_de=0):
+    # Ids reais lidos do banco: a sequence pode ter pulado valores (DELETE, rollback)
+    return conn.execute(select(modelo.id).where(modelo.id > acima_de).order_by(modelo.id)).scalars().all()
+
+def salvar_agenda_excel(caminho, linhas):
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Agenda_Profissional")
+    ws.append(["ProfissionalID", "DiaSemana", "Inicio", "Fim", "TipoAtendimento"])
+    for linha in linhas:
+        ws.append(list(linha))
+    wb.save(caminho)
+
+def popular_engine(engine, n_pacientes=100, n_profissionais=10, n_consultas=500, seed=42, reset=False, agenda_path=None):
+    # Retorna quantas linhas foram gravadas em cada tabela (após o commit)
+    if reset and n_consultas and not (n_pacientes and n_profissionais):
+        # Valida antes de apagar qualquer coisa: após o reset não há ids para reaproveitar
+        raise ValueError("Com --reset, consultas exigem --pacientes e --profissionais maiores que zero")
+
+    rng = random.Random(seed)
+    # Uma única transação, inclusive o reset: se algo falhar (ex.: FK no COPY), nada muda
+    with engine.begin() as conn:
+        if reset:
+            db.metadata.drop_all(conn)
+        db.metadata.create_all(conn)
+
+        maior_paciente = _maior_id(conn, Paciente)
+        inserir_em_lote(conn, Paciente, ["nome", "email", "criado_em"], gerar_pacientes(rng, n_pacientes, maior_paciente + 1))
+        # Sem pacientes novos, as consultas usam os já existentes
+        paciente_ids = _ids(conn, Paciente, maior_paciente if n_pacientes else 0)
+
+        maior_profissional = _maior_id(conn, Profissional)
+        inserir_em_lote(conn, Profissional, ["nome", "especialidade", "criado_em"], gerar_profissionais(rng, n_profissionais))
+        profissional_ids = _ids(conn, Profissional, maior_profissional if n_profissionais else 0)
+
+        if n_consultas:
+            if not paciente_ids or not profissional_ids:
+                raise ValueError("Consultas exigem ao menos um paciente e um profissional no banco")
+            inserir_em_lote(conn, Consulta, ["paciente_id", "profissional_id", "data", "status", "criado_em"],
+                            gerar_consultas(rng, n_consultas, paciente_ids, profissional_ids))
+
+    if agenda_path:
+        salvar_agenda_excel(agenda_path, gerar_agenda(rng, profissional_ids))
+    return {"pacientes": n_pacientes, "profissionais": n_profissionais, "consultas": n_consultas}
+
+def popular(n_pacientes=100, n_profissionais=10, n_consultas=500, seed=42, reset=False, agenda_path=None):
+    # Usa o banco de main.app (DATABASE_URL); em testes, DATABASE_URL=sqlite:// antes de importar main
+    with app.app_context():
+        return popular_engine(db.engine, n_pacientes, n_profissionais, n_consultas, seed, reset, agenda_path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Popula o banco OSZO com dados sintéticos determinísticos")
+    parser.add_argument("--pacientes", type=int, default=100)
+    parser.add_argument("--profissionais", type=int, default=10)
+    parser.add_argument("--consultas", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--reset", action="store_true", help="Apaga e recria as tabelas antes de popular")
+    parser.add_argument("--agenda", metavar="XLSX", help="Gera também uma planilha Agenda_Profissional para gerar_slots.py")
+    args = parser.parse_args()
+
+    if min(args.pacientes, args.profissionais, args.consultas) < 0:
+        sys.exit("Quantidades não podem ser negativas")
+    print(f"Populando banco com seed={args.seed}")
+    try:
+        inseridos = popular(args.pacientes, args.profissionais, args.consultas, args.seed, args.reset, args.agenda)
+    except ValueError as e:
+        sys.exit(f"Erro: {e}. Nada foi alterado.")
+    print(f"{inseridos['pacientes']} pacientes, {inseridos['profissionais']} profissionais e {inseridos['consultas']} consultas inseridos")
+    if args.agenda:
+        print(f"Agenda_Profissional salva em {args.agenda}")
@@ -0,0 +1,19 @@
+import os
+import sys
+
+import pytest
+
+# Banco SQLite em memória: precisa estar definido antes de importar main
+os.environ["DATABASE_URL"] = "sqlite://"
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from main import app, db
+
+
+@pytest.fixture
+def client():
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        yield app.test_client()
+        db.session.remove()
@@ -0,0 +1,90 @@
+import io
+from datetime import datetime
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from main import db, Paciente, Profissional, Consulta, ARROW_STREAM_MIMETYPE, PARQUET_MIMETYPE
+
+SCHEMA_CONSULTAS = pa.schema([
+    ("id", pa.int64()), ("paciente_id", pa.int64()), ("paciente_nome", pa.string()),
+    ("profissional_id", pa.int64()), ("profissional_nome", pa.string()),
+    ("data", pa.timestamp("us")), ("status", pa.string()), ("criado_em", pa.timestamp("us")),
+])
+
+
+def ler_arrow(resp):
+    return pa.ipc.open_stream(resp.get_data()).read_all()
+
+
+def ler_parquet(resp):
+    return pq.read_table(io.BytesIO(resp.get_data()))
+
+
+@pytest.fixture
+def dados(client):
+    db.session.add_all([Paciente(nome="Ana", email="ana@exemplo.com"), Profissional(nome="Dra. Maria", especialidade="Cardiologia")])
+    db.session.commit()
+    db.session.add(Consulta(paciente_id=1, profissional_id=1, data=datetime(2025, 9, 1, 8, 30), status="agendada"))
+    db.session.commit()
+    return client
+
+
+def test_consultas_arrow(dados):
+    resp = dados.get("/api/consultas", headers={"Accept": ARROW_STREAM_MIMETYPE})
+    assert resp.status_code == 200
+    assert resp.mimetype == ARROW_STREAM_MIMETYPE
+    tabela = ler_arrow(resp)
+    assert tabela.schema == SCHEMA_CONSULTAS
+    linha = tabela.to_pylist()[0]
+    assert linha["paciente_nome"] == "Ana"
+    assert linha["profissional_nome"] == "Dra. Maria"
+    assert linha["data"] == datetime(2025, 9, 1, 8, 30)
+
+
+def test_consultas_parquet(dados):
+    resp = dados.get("/api/consultas", headers={"Accept": PARQUET_MIMETYPE})
+    assert resp.mimetype == PARQUET_MIMETYPE
+    tabela = ler_parquet(resp)
+    assert tabela.schema.remove_metadata() == SCHEMA_CONSULTAS
+    assert tabela.num_rows == 1
+
+
+@pytest.mark.parametrize("url, colunas", [
+    ("/api/pacientes", ["id", "nome", "email", "criado_em"]),
+    ("/api/profissionais", ["id", "nome", "especialidade", "criado_em"]),
+])
+def test_listas_arrow_e_parquet(dados, url, colunas):
+    assert ler_arrow(dados.get(url, headers={"Accept": ARROW_STREAM_MIMETYPE})).column_names == colunas
+    assert ler_parquet(dados.get(url, headers={"Accept": PARQUET_MIMETYPE})).column_names == colunas
+
+
+@pytest.mark.parametrize("headers", [{}, {"Accept": "*/*"}, {"Accept": "application/json"}])
+def test_json_continua_padrao(dados, headers):
+    resp = dados.get("/api/consultas", headers=headers)
+    assert resp.mimetype == "application/json"
+    assert resp.get_json()["data"][0]["paciente"] == {"id": 1, "nome": "Ana"}
+
+
+@pytest.mark.parametrize("accept", ["application/json", ARROW_STREAM_MIMETYPE, PARQUET_MIMETYPE])
+def test_vary_accept(dados, accept):
+    resp = dados.get("/api/consultas", headers={"Accept": accept})
+    assert "Accept" in resp.vary
+
+
+def test_tabela_vazia(client):
+    tabela = ler_arrow(client.get("/api/consultas", headers={"Accept": ARROW_STREAM_MIMETYPE}))
+    assert tabela.schema == SCHEMA_CONSULTAS
+    assert tabela.num_rows == 0
+    assert ler_parquet(client.get("/api/consultas", headers={"Accept": PARQUET_MIMETYPE})).num_rows == 0
+
+
+def test_varios_lotes(dados, monkeypatch):
+    monkeypatch.setattr("main.TAMANHO_LOTE_COLUNAR", 2)
+    for hora in range(9, 14):
+        db.session.add(Consulta(paciente_id=1, profissional_id=1, data=datetime(2025, 9, 1, hora), status="confirmada"))
+    db.session.commit()
+    for accept, ler in [(ARROW_STREAM_MIMETYPE, ler_arrow), (PARQUET_MIMETYPE, ler_parquet)]:
+        tabela = ler(dados.get("/api/consultas", headers={"Accept": accept}))
+        assert tabela["id"].to_pylist() == [1, 2, 3, 4, 5, 6]
@@ -0,0 +1,71 @@
+import pyarrow as pa
+import pytest
+from sqlalchemy import text
+
+import populate_db
+from main import db, ARROW_STREAM_MIMETYPE
+
+
+def contar(tabela):
+    return db.session.execute(text(f"SELECT COUNT(*) FROM {tabela}")).scalar()
+
+
+def conteudo():
+    return [db.session.execute(text(f"SELECT * FROM {t} ORDER BY id")).fetchall() for t in ("pacientes", "profissionais", "consultas")]
+
+
+def test_escala_endpoint_consultas(client):
+    populate_db.popular(2000, 50, 20000, seed=7, reset=True)
+
+    resp = client.get("/api/consultas")
+    dados = resp.get_json()["data"]
+    assert len(dados) == 20000
+    assert [c["data"] for c in dados] == sorted(c["data"] for c in dados)
+
+    tabela = pa.ipc.open_stream(client.get("/api/consultas", headers={"Accept": ARROW_STREAM_MIMETYPE}).get_data()).read_all()
+    assert tabela.num_rows == 20000
+    assert set(tabela["paciente_id"].to_pylist()) <= set(range(1, 2001))
+
+
+def test_mesma_seed_mesmos_dados(client):
+    populate_db.popular(300, 10, 1000, seed=3, reset=True)
+    primeiro = conteudo()
+    db.session.remove()
+    populate_db.popular(300, 10, 1000, seed=3, reset=True)
+    assert conteudo() == primeiro
+
+
+def test_consultas_usam_ids_existentes(client):
+    populate_db.popular(20, 3, 0, reset=True)
+    populate_db.popular(0, 0, 100, seed=1)
+    assert contar("consultas") == 100
+    assert contar("consultas WHERE paciente_id NOT IN (SELECT id FROM pacientes)") == 0
+
+
+def test_reset_invalido_preserva_dados(client):
+    populate_db.popular(5, 2, 10, reset=True)
+    with pytest.raises(ValueError):
+        populate_db.popular(0, 0, 5, reset=True)
+    assert contar("pacientes") == 5
+
+
+def test_sem_pacientes_nada_e_gravado(client):
+    with pytest.raises(ValueError):
+        populate_db.popular(5, 0, 10)
+    assert contar("pacientes") == 0
+
+
+def test_falha_no_meio_desfaz_tudo(client, monkeypatch):
+    populate_db.popular(10, 2, 10, reset=True)
+    original = populate_db.gerar_consultas
+
+    def quebra(*args):
+        for i, linha in enumerate(original(*args)):
+            if i == 15000:
+                raise RuntimeError("falha simulada")
+            yield linha
+
+    monkeypatch.setattr(populate_db, "gerar_consultas", quebra)
+    with pytest.raises(RuntimeError):
+        populate_db.popular(50, 5, 20000)
+    assert [contar(t) for t in ("pacientes", "profissionais", "consultas")] == [10, 2, 10]